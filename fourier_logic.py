@@ -1,118 +1,321 @@
 import numpy as np
-from typing import Callable, Tuple, Dict, List
+from typing import Callable, Tuple, Dict, List, Optional
 import json
+import io
+
+# scipy.fft can spread a transform across cores; fall back to NumPy's
+try:
+    from scipy import fft as _fft
+    _FFT_KWARGS = {'workers': -1}
+except ImportError:
+    _fft = np.fft
+    _FFT_KWARGS = {}
+
+def _json_default(obj):
+    """Serialize NumPy values that the json module does not know about"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def _is_fast_length(n: int) -> bool:
+    """Whether n factors into 2, 3, 5 and 7 only (cheap FFT sizes)"""
+    for p in (2, 3, 5, 7):
+        while n % p == 0:
+            n //= p
+    return n == 1
+
+def _grid_key(t: np.ndarray) -> tuple:
+    """Cache key for a time grid; hashes the samples so distinct grids never collide"""
+    return (len(t), t.dtype, hash(t.tobytes()))
+
+def _square_coeffs(n_harmonics: int, A: float = 1) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Closed-form coefficients of the square wave: bn = 4A/(nπ) for odd n"""
+    n = np.arange(1, n_harmonics + 1)
+    bn = np.where(n % 2 == 1, 4*A / (n*np.pi), 0.0)
+    return 0.0, np.zeros(n_harmonics), bn
+
+def _sawtooth_coeffs(n_harmonics: int, A: float = 1) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Closed-form coefficients of the rising sawtooth: bn = -2A/(nπ)"""
+    n = np.arange(1, n_harmonics + 1)
+    return 0.0, np.zeros(n_harmonics), -2*A / (n*np.pi)
+
+def _triangle_coeffs(n_harmonics: int, A: float = 1) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Closed-form coefficients of the triangle wave: an = 8A/(nπ)² for odd n"""
+    n = np.arange(1, n_harmonics + 1)
+    an = np.where(n % 2 == 1, 8*A / (n*np.pi)**2, 0.0)
+    return 0.0, an, np.zeros(n_harmonics)
+
+def _half_wave_coeffs(n_harmonics: int, A: float = 1) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Closed-form coefficients of the half-wave rectified sine"""
+    n = np.arange(1, n_harmonics + 1)
+    # an = -2A/(π(n²-1)) for even n; the max() only guards the unused n=1 slot
+    an = np.where(n % 2 == 0, -2*A / (np.pi * np.maximum(n**2 - 1, 1)), 0.0)
+    bn = np.where(n == 1, A/2, 0.0)
+    return 2*A/np.pi, an, bn
+
+def _pulse_train_coeffs(n_harmonics: int, A: float = 1, duty: float = 0.2) -> Tuple[float, np.ndarray, np.ndarray]:
+    """Closed-form coefficients of a pulse train with the given duty cycle"""
+    n = np.arange(1, n_harmonics + 1)
+    an = A / (n*np.pi) * np.sin(2*np.pi*n*duty)
+    bn = A / (n*np.pi) * (1 - np.cos(2*np.pi*n*duty))
+    return 2*A*duty, an, bn
 
 class FourierSeriesAnalyzer:
     """Enhanced Fourier Series analyzer for educational purposes"""
     
+    TRIG_CACHE_SIZE = 8
+    
     def __init__(self, period: float = 2*np.pi):
         self.period = period
         self.omega0 = 2*np.pi / period
         self.predefined_functions = self._load_function_library()
+        self._trig_cache: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        self._grid_cache: Dict[tuple, np.ndarray] = {}
+        self._plan_cache: Dict[tuple, Optional[Tuple[int, int, bool]]] = {}
         
     def _load_function_library(self) -> Dict:
         """Library of educational function examples"""
-        return {
+        library = {
             'square': {
                 'name': 'Square Wave',
                 'formula': 'A if (t%T) < T/2 else -A',
                 'description': 'Classic square wave with odd harmonics only',
-                'func': lambda t, A=1, T=None: np.where((t % (T or self.period)) < (T or self.period)/2, A, -A)
+                'func': lambda t, A=1, T=None: np.where((t % (T or self.period)) < (T or self.period)/2, A, -A),
+                'coeffs': _square_coeffs
             },
             'sawtooth': {
                 'name': 'Sawtooth Wave',
                 'formula': '2A((t%T)/T) - A',
                 'description': 'Linear ramp with all harmonics',
-                'func': lambda t, A=1, T=None: A * (2*((t % (T or self.period))/(T or self.period)) - 1)
+                'func': lambda t, A=1, T=None: A * (2*((t % (T or self.period))/(T or self.period)) - 1),
+                'coeffs': _sawtooth_coeffs
             },
             'triangle': {
                 'name': 'Triangle Wave',
                 'formula': '2A|2((t%T)/T - 0.5)| - A',
                 'description': 'Triangle wave with odd harmonics only',
-                'func': lambda t, A=1, T=None: A * (2*np.abs(2*((t % (T or self.period))/(T or self.period) - 0.5)) - 1)
+                'func': lambda t, A=1, T=None: A * (2*np.abs(2*((t % (T or self.period))/(T or self.period) - 0.5)) - 1),
+                'coeffs': _triangle_coeffs
             },
             'half_wave': {
                 'name': 'Half-Wave Rectified Sine',
                 'formula': 'max(0, A*sin(2πt/T))',
                 'description': 'Rectified sine wave with DC component',
-                'func': lambda t, A=1, T=None: np.maximum(0, A * np.sin(2*np.pi*t/(T or self.period)))
+                'func': lambda t, A=1, T=None: np.maximum(0, A * np.sin(2*np.pi*t/(T or self.period))),
+                'coeffs': _half_wave_coeffs
             },
             'pulse_train': {
                 'name': 'Pulse Train',
                 'formula': 'A if (t%T) < duty*T else 0',
                 'description': 'Periodic pulses with adjustable duty cycle',
-                'func': lambda t, A=1, T=None, duty=0.2: np.where((t % (T or self.period)) < duty*(T or self.period), A, 0)
+                'func': lambda t, A=1, T=None, duty=0.2: np.where((t % (T or self.period)) < duty*(T or self.period), A, 0),
+                'coeffs': _pulse_train_coeffs
             }
         }
+        
+        # Let compute_coefficients recognize the presets from the callable
+        for entry in library.values():
+            entry['func'].coeffs = entry['coeffs']
+        return library
     
-    def compute_coefficients(self, func: Callable, n_harmonics: int, n_points: int = 2000) -> Tuple[float, np.ndarray, np.ndarray]:
+    def compute_coefficients(self, func: Callable, n_harmonics: int, n_points: int = 2000,
+                             dtype=np.float64) -> Tuple[float, np.ndarray, np.ndarray]:
         """Compute Fourier coefficients with educational metrics"""
-        t = np.linspace(0, self.period, n_points, endpoint=False)
-        f_samples = func(t)
+        # Library waveforms carry their closed-form series; no integration needed
+        coeffs = getattr(func, 'coeffs', None)
+        if coeffs is not None:
+            a0, an, bn = coeffs(n_harmonics)
+            ab = np.vstack([an, bn]).astype(dtype, copy=False)
+            return a0, ab[0], ab[1]
+        
+        t = self._sample_grid(n_points, dtype)
+        f_samples = np.asarray(func(t)).astype(dtype, copy=False)
+        
+        # The FFT only resolves harmonics below Nyquist
+        if n_harmonics >= n_points // 2:
+            return self._project_coefficients(t, f_samples, n_harmonics)
+        
+        # One real FFT over a full period yields every harmonic at once:
+        # on a uniform endpoint=False grid the rectangle rule is exact for
+        # the DFT basis, so an/bn are just the scaled real/imag bins
+        spectrum = _fft.rfft(f_samples, **_FFT_KWARGS)
         
         # DC component
-        a0 = (2/self.period) * np.trapz(f_samples, t)
+        a0 = (2/n_points) * spectrum[0].real
+        
+        # Harmonics, stored as one contiguous (2, H) block; an/bn are row views
+        ab = np.empty((2, n_harmonics), dtype=dtype)
+        ab[0] = (2/n_points) * spectrum.real[1:n_harmonics + 1]
+        ab[1] = -(2/n_points) * spectrum.imag[1:n_harmonics + 1]
+        
+        return a0, ab[0], ab[1]
+    
+    def _sample_grid(self, n_points: int, dtype=np.float64) -> np.ndarray:
+        """Return the one-period sampling grid, reused across calls"""
+        key = (n_points, self.period, np.dtype(dtype))
+        t = self._grid_cache.get(key)
+        if t is None:
+            t = np.linspace(0, self.period, n_points, endpoint=False, dtype=dtype)
+            t.flags.writeable = False
+            if len(self._grid_cache) >= self.TRIG_CACHE_SIZE:
+                self._grid_cache.pop(next(iter(self._grid_cache)))
+            self._grid_cache[key] = t
+        return t
+    
+    def _harmonic_basis(self, t: np.ndarray, n_harmonics: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the (H, N) cos/sin basis for harmonics 1..H (cached per grid)"""
+        key = (_grid_key(t), n_harmonics, self.omega0)
+        if key in self._trig_cache:
+            return self._trig_cache[key]
+        
+        # exp(i*n*w0*t) = exp(i*w0*t)**n, so one complex exp plus a running
+        # product replaces 2H separate cos/sin evaluations
+        z1 = np.exp(1j * self.omega0 * t)
+        Z = np.cumprod(np.broadcast_to(z1, (n_harmonics, len(t))), axis=0)
+        C, S = Z.real.copy(), Z.imag.copy()
+        C.flags.writeable = False
+        S.flags.writeable = False
         
-        # Initialize arrays
-        an = np.zeros(n_harmonics)
-        bn = np.zeros(n_harmonics)
+        # Keep only the most recent grids; slider drags produce new periods
+        if len(self._trig_cache) >= self.TRIG_CACHE_SIZE:
+            self._trig_cache.pop(next(iter(self._trig_cache)))
+        self._trig_cache[key] = (C, S)
+        return C, S
+    
+    def _project_coefficients(self, t: np.ndarray, f_samples: np.ndarray, n_harmonics: int) -> Tuple[float, np.ndarray, np.ndarray]:
+        """Project samples on a uniform one-period grid onto the cos/sin basis"""
+        C, S = self._harmonic_basis(t, n_harmonics)
         
-        # Compute harmonics
-        for n in range(1, n_harmonics + 1):
-            cos_n = np.cos(n * self.omega0 * t)
-            sin_n = np.sin(n * self.omega0 * t)
-            an[n-1] = (2/self.period) * np.trapz(f_samples * cos_n, t)
-            bn[n-1] = (2/self.period) * np.trapz(f_samples * sin_n, t)
+        # t is uniform with endpoint=False, so the periodic trapezoid rule
+        # weights every sample by dx; stack cos/sin rows for a single matvec
+        dx = self.period / len(t)
+        ab = (2/self.period) * (np.vstack([C, S]) @ (dx * f_samples))
+        ab = ab.reshape(2, n_harmonics)
         
-        return a0, an, bn
+        a0 = (2/self.period) * dx * np.sum(f_samples)
+        
+        return a0, ab[0], ab[1]
     
-    def synthesize_progressive(self, a0: float, an: np.ndarray, bn: np.ndarray, t: np.ndarray) -> List[np.ndarray]:
-        """Generate progressive reconstruction for animation"""
-        reconstructions = []
-        signal = a0/2 * np.ones_like(t)
-        reconstructions.append(signal.copy())
+    def synthesize_progressive(self, a0: float, an: np.ndarray, bn: np.ndarray, t: np.ndarray,
+                               dtype=np.float64) -> np.ndarray:
+        """Generate progressive reconstruction for animation
+        
+        Returns an (H+1, T) array whose row h is the partial sum up to harmonic h.
+        """
+        t = t.astype(dtype, copy=False)
+        an = an.astype(dtype, copy=False)
+        bn = bn.astype(dtype, copy=False)
         
-        for n in range(len(an)):
-            signal += an[n] * np.cos((n+1) * self.omega0 * t)
-            signal += bn[n] * np.sin((n+1) * self.omega0 * t)
-            reconstructions.append(signal.copy())
+        # Row 0 is the DC baseline; rows 1..H accumulate the per-harmonic
+        # contributions in place inside one preallocated buffer
+        C, S = self._harmonic_basis(t, len(an))
+        out = np.empty((len(an) + 1, t.size), dtype=dtype)
+        out[0] = a0/2
+        partial = out[1:]
+        np.multiply(an[:, None], C, out=partial)
+        partial += bn[:, None] * S
+        np.cumsum(partial, axis=0, out=partial)
+        partial += out[0]
         
-        return reconstructions
+        return out
     
     def synthesize_selective(self, a0: float, an: np.ndarray, bn: np.ndarray, t: np.ndarray, 
-                           enabled_harmonics: List[bool]) -> np.ndarray:
+                           enabled_harmonics: List[bool], dtype=np.float64) -> np.ndarray:
         """Synthesize with selective harmonics enabled"""
-        signal = a0/2 * np.ones_like(t)
+        t = t.astype(dtype, copy=False)
+        an = an.astype(dtype, copy=False)
+        bn = bn.astype(dtype, copy=False)
+        
+        mask = self.selection_mask(enabled_harmonics, len(an), dtype)
+        
+        # Uniform grids over whole periods are an inverse real DFT of the
+        # coefficients, which skips the (H, N) basis altogether
+        plan = self._periodic_grid(t, len(an))
+        if plan is not None:
+            return self._inverse_rfft(a0, an * mask, bn * mask, *plan).astype(dtype, copy=False)
+        
+        # Checkbox toggles reuse the same grid, so the basis is a cache hit
+        C, S = self._harmonic_basis(t, len(an))
+        signal = np.asarray(a0/2, dtype=dtype) + (an * mask) @ C + (bn * mask) @ S
+        
+        return signal
+    
+    def _periodic_grid(self, t: np.ndarray, n_harmonics: int) -> Optional[Tuple[int, int, bool]]:
+        """Return (M, periods, endpoint) if t = j*dt from 0 spans whole periods, else None"""
+        key = (_grid_key(t), n_harmonics, self.period)
+        if key in self._plan_cache:
+            return self._plan_cache[key]
         
-        for n, enabled in enumerate(enabled_harmonics):
-            if enabled and n < len(an):
-                signal += an[n] * np.cos((n+1) * self.omega0 * t)
-                signal += bn[n] * np.sin((n+1) * self.omega0 * t)
+        plan = None
+        n = len(t)
+        if n >= 4 and t[0] == 0:
+            dt = t[-1] / (n - 1)
+            # linspace(..., endpoint=True) repeats sample 0 at the end of the span
+            for m, endpoint in ((n - 1, True), (n, False)):
+                periods = m * dt / self.period
+                cycles = round(periods)
+                if (cycles >= 1 and abs(periods - cycles) < 1e-9 * periods
+                        and cycles * n_harmonics < m // 2 and _is_fast_length(m)
+                        and np.allclose(t, dt * np.arange(n), rtol=0, atol=1e-9 * t[-1])):
+                    plan = (m, cycles, endpoint)
+                    break
         
+        if len(self._plan_cache) >= self.TRIG_CACHE_SIZE:
+            self._plan_cache.pop(next(iter(self._plan_cache)))
+        self._plan_cache[key] = plan
+        return plan
+    
+    def _inverse_rfft(self, a0: float, an: np.ndarray, bn: np.ndarray, m: int, periods: int,
+                      endpoint: bool) -> np.ndarray:
+        """Evaluate the series on m uniform samples of `periods` whole periods"""
+        # Harmonic k completes `periods` cycles over the span, so it lands in
+        # bin periods*k; irfft supplies the conjugate half (Hermitian symmetry)
+        spectrum = np.zeros(m // 2 + 1, dtype=np.promote_types(an.dtype, np.complex64))
+        spectrum[0] = a0/2 * m
+        spectrum[periods:periods * (len(an) + 1):periods] = (an - 1j*bn) * (m/2)
+        signal = _fft.irfft(spectrum, n=m, **_FFT_KWARGS)
+        if endpoint:
+            signal = np.append(signal, signal[0])
         return signal
     
+    @staticmethod
+    def selection_mask(enabled_harmonics: List[bool], n_harmonics: int, dtype=np.float64) -> np.ndarray:
+        """Return a 0/1 weight per harmonic from a (possibly shorter) enable list"""
+        # Harmonics without a checkbox entry count as disabled
+        mask = np.zeros(n_harmonics, dtype=dtype)
+        enabled = np.asarray(enabled_harmonics[:n_harmonics], dtype=dtype)
+        mask[:len(enabled)] = enabled
+        return mask
+    
     def compute_metrics(self, original: np.ndarray, reconstructed: np.ndarray) -> Dict:
         """Compute educational metrics"""
-        rms_error = np.sqrt(np.mean((original - reconstructed)**2))
-        max_error = np.max(np.abs(original - reconstructed))
-        snr = 20 * np.log10(np.std(original) / (rms_error + 1e-12))
+        # Form the residual once and reduce it in place
+        error = original - reconstructed
+        rms_error = np.sqrt(np.dot(error, error) / error.size)
+        max_error = np.max(np.abs(error, out=error))
+        signal_std = np.std(original)
+        snr = 20 * np.log10(signal_std / (rms_error + 1e-12))
         
         return {
             'rms_error': rms_error,
             'max_error': max_error,
             'snr_db': snr,
-            'relative_error': rms_error / (np.std(original) + 1e-12)
+            'relative_error': rms_error / (signal_std + 1e-12)
         }
     
-    def get_harmonic_analysis(self, an: np.ndarray, bn: np.ndarray) -> Dict:
+    def get_harmonic_analysis(self, an: np.ndarray, bn: np.ndarray, include_phase: bool = True,
+                              include_magnitude: bool = True) -> Dict:
         """Analyze harmonic content for educational insights"""
-        magnitude = np.sqrt(an**2 + bn**2)
-        phase = np.arctan2(bn, an)
-        power = magnitude**2
+        power = an*an + bn*bn
         total_power = np.sum(power)
+        # Callers that only need power figures can skip the sqrt/arctan2 passes
+        magnitude = np.sqrt(power) if include_magnitude else None
+        phase = np.arctan2(bn, an) if include_phase else None
         
-        # Find dominant harmonics
-        dominant_indices = np.argsort(magnitude)[-5:][::-1]
+        # Find dominant harmonics (power orders the same as magnitude)
+        dominant_indices = np.argsort(power)[-5:][::-1]
         
         return {
             'magnitude': magnitude,
@@ -128,15 +331,42 @@ class FourierSeriesAnalyzer:
     def export_data(self, t: np.ndarray, original: np.ndarray, reconstructed: np.ndarray, 
                    a0: float, an: np.ndarray, bn: np.ndarray) -> Dict:
         """Export analysis data for educational use"""
+        # Arrays stay as contiguous ndarrays; use export_json for a text dump
         return {
-            'time': t.tolist(),
-            'original_signal': original.tolist(),
-            'reconstructed_signal': reconstructed.tolist(),
+            'time': t,
+            'original_signal': original,
+            'reconstructed_signal': reconstructed,
             'coefficients': {
                 'a0': float(a0),
-                'an': an.tolist(),
-                'bn': bn.tolist()
+                'an': an,
+                'bn': bn
             },
             'analysis': self.get_harmonic_analysis(an, bn),
             'metrics': self.compute_metrics(original, reconstructed)
         }
+    
+    def export_json(self, t: np.ndarray, original: np.ndarray, reconstructed: np.ndarray, 
+                   a0: float, an: np.ndarray, bn: np.ndarray) -> str:
+        """Export analysis data as a JSON string"""
+        return json.dumps(self.export_data(t, original, reconstructed, a0, an, bn), default=_json_default)
+    
+    def export_npz(self, t: np.ndarray, original: np.ndarray, reconstructed: np.ndarray, 
+                  a0: float, an: np.ndarray, bn: np.ndarray) -> bytes:
+        """Export analysis data as an in-memory .npz blob (load with np.load)"""
+        data = self.export_data(t, original, reconstructed, a0, an, bn)
+        analysis = data['analysis']
+        
+        # Scalar metadata travels as a small JSON header next to the arrays
+        header = {
+            'a0': data['coefficients']['a0'],
+            'metrics': data['metrics'],
+            'total_power': analysis['total_power'],
+            'fundamental_power': analysis['fundamental_power'],
+            'thd': analysis['thd']
+        }
+        
+        buf = io.BytesIO()
+        np.savez(buf, time=t, original=original, reconstructed=reconstructed, an=an, bn=bn,
+                 magnitude=analysis['magnitude'], phase=analysis['phase'],
+                 header=np.array(json.dumps(header, default=_json_default)))
+        return buf.getvalue()